@@ -11,7 +11,6 @@
 # Laboratory: Simulation Laboratory Neuroscience
 # Team: Multi-scale Simulation and Design
 # ------------------------------------------------------------------------------
-import multiprocessing
 import os
 import sys
 import signal
@@ -219,13 +218,9 @@ class ApplicationCompanion:
         if self.__port_range is None:
             # proxies to the shared queues
             # for in-coming messages
-            self.__queue_in = (
-                multiprocessing.Manager().Queue()
-            )
+            self.__queue_in = utils.queue_manager().Queue()
             # for out-going messages
-            self.__queue_out = (
-                multiprocessing.Manager().Queue()
-            )
+            self.__queue_out = utils.queue_manager().Queue()
             self.__endpoints_address = (self.__queue_in, self.__queue_out)
             return Response.OK
         else:
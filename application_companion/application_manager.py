@@ -12,11 +12,9 @@
 # Team: Multi-scale Simulation and Design
 # ------------------------------------------------------------------------------
 import re
-import multiprocessing
 import os
 import subprocess
 import time
-import signal
 import fcntl
 import ast
 import zmq
@@ -106,12 +104,7 @@ class ApplicationManager:
             log_settings=log_settings,
             configurations_manager=configurations_manager
         )
-        signal.signal(signal.SIGINT,
-                      self.__signal_manager.interrupt_signal_handler
-                      )
-        signal.signal(signal.SIGTERM,
-                      self.__signal_manager.kill_signal_handler
-                      )
+        self.__signal_manager.install_signal_handlers()
         # event to record that SIGINT signal is captured
         self.__stop_event = self.__signal_manager.shut_down_event
         # event to record that SIGTERM signal is captured
@@ -897,9 +890,9 @@ class ApplicationManager:
         if self.__port_range_for_application_manager is None:
             # proxies to the shared queues
             # for in-coming messages
-            self.__application_manager_in_queue = multiprocessing.Manager().Queue()
+            self.__application_manager_in_queue = utils.queue_manager().Queue()
             # for out-going messages
-            self.__application_manager_out_queue = multiprocessing.Manager().Queue()
+            self.__application_manager_out_queue = utils.queue_manager().Queue()
             self.__endpoints_address = (self.__application_manager_in_queue,
                                         self.__application_manager_out_queue)
             return Response.OK
@@ -11,9 +11,147 @@
 # Laboratory: Simulation Laboratory Neuroscience
 #       Team: Multi-scale Simulation and Design
 # ------------------------------------------------------------------------------
-import multiprocessing
+import os
+import select
+import signal
 import time
 
+from EBRAINS_RichEndpoint.orchestrator import utils
+
+# self-pipe shared by all the signal managers of this process, and the id of
+# the process which created it
+_wakeup_pipe = None
+_wakeup_pipe_pid = None
+
+
+def wakeup_pipe():
+    """
+    returns the read and write ends of the self-pipe used as the wakeup fd of
+    this process.
+    NOTE signal.set_wakeup_fd() is process-wide, so the pipe is created at the
+    first call and is shared afterwards by all the signal managers in this
+    process. A forked child creates its own pipe instead of sharing the one
+    inherited from its parent.
+    """
+    global _wakeup_pipe, _wakeup_pipe_pid
+    if _wakeup_pipe is None or _wakeup_pipe_pid != os.getpid():
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        _wakeup_pipe = (read_fd, write_fd)
+        _wakeup_pipe_pid = os.getpid()
+    return _wakeup_pipe
+
+
+class EventFD:
+    """
+    A one-bit event backed by a single file descriptor i.e. an eventfd(2)
+    counter on Linux, or a non-blocking pipe where eventfd is not available.
+
+    It mirrors the set/clear/is_set/wait interface of multiprocessing.Event,
+    and in addition exposes the file descriptor via fileno() so that the
+    event can be waited for along with the sockets e.g. by a zmq.Poller.
+
+    NOTE the descriptor is inherited by the child processes created by fork,
+    so the event is shared with them. Unlike multiprocessing.Event, it can not
+    be pickled e.g. to be passed to a spawned child process, since the
+    descriptor would be meaningless there.
+    """
+    def __init__(self):
+        # NOTE initialized first so that close() is safe even if the
+        # descriptor(s) could not be created
+        self.__read_fd = self.__write_fd = None
+        if hasattr(os, 'eventfd'):
+            self.__read_fd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+            self.__write_fd = self.__read_fd
+            self.__notification = (1).to_bytes(8, 'little')
+        else:
+            # Case, eventfd is not supported, fall back to a self-pipe
+            self.__read_fd, self.__write_fd = os.pipe()
+            os.set_blocking(self.__read_fd, False)
+            os.set_blocking(self.__write_fd, False)
+            self.__notification = b'\x00'
+
+    def __reduce__(self):
+        raise TypeError('EventFD can not be pickled, it is shared only with '
+                        'the child processes created by fork')
+
+    def __del__(self):
+        self.close()
+
+    def fileno(self): return self.__read_fd
+
+    def close(self):
+        """
+        closes the file descriptor(s) of the event.
+        """
+        if self.__read_fd is None:
+            # Case, already closed
+            return
+        os.close(self.__read_fd)
+        if self.__write_fd != self.__read_fd:
+            os.close(self.__write_fd)
+        self.__read_fd = self.__write_fd = None
+
+    def __poll(self, timeout):
+        """
+        helper function to wait until the file descriptor is readable or the
+        timeout (in milliseconds) expires.
+        NOTE poll() is used rather than select() which is limited to the
+        descriptors below FD_SETSIZE. A new poll object is created per call,
+        since a poll object can not be polled concurrently e.g. by is_set()
+        while wait() is blocked in another thread.
+        """
+        poller = select.poll()
+        poller.register(self.__read_fd, select.POLLIN)
+        return bool(poller.poll(timeout))
+
+    def is_set(self):
+        """
+        returns True if the event is set i.e. its file descriptor is
+        readable, otherwise returns False.
+        """
+        return self.__poll(0)
+
+    def set(self):
+        """
+        sets the event, and thus wakes up all the waits on it.
+        """
+        try:
+            os.write(self.__write_fd, self.__notification)
+        except BlockingIOError:
+            # Case, counter (or pipe) is full i.e. the event is already set
+            pass
+
+    def clear(self):
+        """
+        resets the event by consuming its pending notifications.
+        """
+        try:
+            while os.read(self.__read_fd, 512):
+                pass
+        except BlockingIOError:
+            # Case, no more pending notifications
+            pass
+
+    def wait(self, timeout=None):
+        """
+        blocks until the event is set or the timeout (in seconds) expires.
+
+        Parameters
+        ----------
+        timeout : float
+            maximum time to wait, waits forever if it is None
+
+        Returns
+        ------
+            True if the event is set, False otherwise
+        """
+        if timeout is not None:
+            # poll() expects the timeout in milliseconds
+            timeout *= 1000
+        return self.__poll(timeout)
+
 
 class SignalManager:
     """
@@ -25,15 +163,19 @@ class SignalManager:
                  ):
         self._log_settings = log_settings
         self._configurations_manager = configurations_manager
-        self.__logger = self._configurations_manager.load_log_configurations(
-                                        name=__name__,
-                                        log_configurations=self._log_settings)
+        self.__logger = utils.load_logger(self._configurations_manager,
+                                          __name__,
+                                          self._log_settings)
         self.__logger.debug("logger is configured.")
         # self.__gracefull_shutdown = False
-        self.__shut_down_event = multiprocessing.Event()
-        self.__kill_event = multiprocessing.Event()
-        self.__alarm_event = multiprocessing.Event()
+        self.__shut_down_event = EventFD()
+        self.__kill_event = EventFD()
+        self.__alarm_event = EventFD()
         self.__grace_period = grace_period
+        # self-pipe to make the received signals readable from a file
+        # descriptor so that they could be waited for along with the sockets
+        # NOTE the pipe is shared by all the signal managers of this process
+        self.__wakeup_fd, self.__wakeup_fd_write = wakeup_pipe()
 
     @property
     def kill_event(self): return self.__kill_event
@@ -44,8 +186,35 @@ class SignalManager:
     @property
     def alarm_event(self): return self.__alarm_event
 
+    @property
+    def wakeup_fd(self): return self.__wakeup_fd
+
     def reset_alarm(self): self.__alarm_event.clear()
 
+    def install_signal_handlers(self):
+        """
+        installs the handlers for SIGINT and SIGTERM signals, and sets
+        wakeup_fd as the wakeup fd of the process so that the signals are
+        notified on it as soon as they are received i.e. even before the
+        handlers are run by the interpreter.
+
+        NOTE it must be called from the main thread.
+        """
+        signal.signal(signal.SIGINT, self.interrupt_signal_handler)
+        signal.signal(signal.SIGTERM, self.kill_signal_handler)
+        signal.set_wakeup_fd(self.__wakeup_fd_write, warn_on_full_buffer=False)
+
+    def clear_wakeup_fd(self):
+        """
+        consumes the pending notifications from wakeup_fd.
+        """
+        try:
+            while os.read(self.__wakeup_fd, 512):
+                pass
+        except BlockingIOError:
+            # Case, no more pending notifications
+            pass
+
     def kill_signal_handler(self, *args):
         """
         handler for SIGTERM signal
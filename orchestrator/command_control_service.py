@@ -11,7 +11,6 @@
 # Laboratory: Simulation Laboratory Neuroscience
 # Team: Multi-scale Simulation and Design
 # ------------------------------------------------------------------------------
-import multiprocessing
 import os
 import zmq
 import sys
@@ -93,9 +92,9 @@ class CommandControlService:
         if ports_for_command_control_channel is None:
             # proxies to the shared queues
             # for in-coming messages
-            self.__queue_in = multiprocessing.Manager().Queue()
+            self.__queue_in = utils.queue_manager().Queue()
             # for out-going messages
-            self.__queue_out = multiprocessing.Manager().Queue()
+            self.__queue_out = utils.queue_manager().Queue()
             self.__endpoints_address = (self.__queue_in, self.__queue_out)
             return Response.OK
         else:
@@ -13,6 +13,8 @@
 # ------------------------------------------------------------------------------
 import abc
 
+from EBRAINS_RichEndpoint.application_companion.common_enums import Response
+
 
 class CommunicatorBaseClass(metaclass=abc.ABCMeta):
     '''
@@ -66,6 +68,40 @@ class CommunicatorBaseClass(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError
 
+    def send_and_receive(self, message, send_endpoint, receive_endpoint=None):
+        """sends the message and then waits for the reply.
+
+        NOTE it is a convenience wrapper that calls send() followed by
+        receive(), so it issues the same transitions as calling them
+        separately.
+
+        Parameters
+        ----------
+        message : ...
+            the message to be sent
+
+        send_endpoint : ...
+            destination where the message to be sent
+
+        receive_endpoint : ...
+            from where the reply to be received. If it is not provided then
+            the reply is received from send_endpoint e.g. a REQ socket
+
+        Returns
+        ------
+            (return code, reply): tuple
+            return code as int indicating whether the message is sent, and the
+            received reply e.g. the responses or an int code if receiving is
+            aborted such as EVENT.FATAL. The reply is None if the message
+            could not be sent.
+        """
+        if receive_endpoint is None:
+            receive_endpoint = send_endpoint
+        # NOTE relevant exception is already logged by send()
+        if self.send(message, send_endpoint) == Response.ERROR:
+            return Response.ERROR, None
+        return Response.OK, self.receive(receive_endpoint)
+
     @abc.abstractmethod
     def broadcast_all(self, message, endpoints):
         """broadcast the message to all specified endpoints.
@@ -12,12 +12,12 @@
 #
 # ------------------------------------------------------------------------------
 import queue
-import signal
 
 from EBRAINS_RichEndpoint.application_companion.signal_manager import SignalManager
 from EBRAINS_RichEndpoint.application_companion.common_enums import EVENT
 from EBRAINS_RichEndpoint.application_companion.common_enums import Response
 from EBRAINS_RichEndpoint.orchestrator.communicator_base import CommunicatorBaseClass
+from EBRAINS_RichEndpoint.orchestrator import utils
 
 
 class CommunicatorQueue(CommunicatorBaseClass):
@@ -29,17 +29,12 @@ class CommunicatorQueue(CommunicatorBaseClass):
     def __init__(self, log_settings, configurations_manager) -> None:
         self._log_settings = log_settings
         self._configurations_manager = configurations_manager
-        self.__logger = self._configurations_manager.load_log_configurations(
-                                        name=__name__,
-                                        log_configurations=self._log_settings)
+        self.__logger = utils.load_logger(self._configurations_manager,
+                                          __name__,
+                                          self._log_settings)
         self.__signal_manager = SignalManager(
                                         self._log_settings, self._configurations_manager)
-        signal.signal(signal.SIGINT,
-                      self.__signal_manager.interrupt_signal_handler
-                      )
-        signal.signal(signal.SIGTERM,
-                      self.__signal_manager.kill_signal_handler
-                      )
+        self.__signal_manager.install_signal_handlers()
         self.__stop_event = self.__signal_manager.shut_down_event
         self.__kill_event = self.__signal_manager.kill_event
         self.__logger.debug("initialized.")
@@ -11,13 +11,25 @@
 #       Team: Multi-scale Simulation and Design
 #
 # ------------------------------------------------------------------------------
-import signal
 import pickle
+import struct
+import zmq
 
 from EBRAINS_RichEndpoint.application_companion.signal_manager import SignalManager
 from EBRAINS_RichEndpoint.application_companion.common_enums import EVENT
 from EBRAINS_RichEndpoint.application_companion.common_enums import Response
+from EBRAINS_RichEndpoint.application_companion.common_enums import SteeringCommands
 from EBRAINS_RichEndpoint.orchestrator.communicator_base import CommunicatorBaseClass
+from EBRAINS_RichEndpoint.orchestrator import utils
+
+
+# NOTE the enums are sent as compact frames i.e. a tag identifying the enum
+# class followed by the enum value, rather than as pickles. The frames are
+# distinguished from pickles since a pickle (protocol 2 or higher) starts
+# with the PROTO opcode b'\x80'.
+_ENUM_FRAME = struct.Struct('<Bh')
+_ENUMS_BY_TAG = (SteeringCommands, Response, EVENT)
+_TAGS_BY_ENUM = {enum_class: tag for tag, enum_class in enumerate(_ENUMS_BY_TAG)}
 
 
 class CommunicatorZMQ(CommunicatorBaseClass):
@@ -26,22 +38,23 @@ class CommunicatorZMQ(CommunicatorBaseClass):
     the underlying communication protocol. This class provides wrappers
     for inter process communication using python Queues.
     '''
-    def __init__(self, log_settings, configurations_manager) -> None:
+    def __init__(self, log_settings, configurations_manager,
+                 poll_timeout=1000) -> None:
         self._log_settings = log_settings
         self._configurations_manager = configurations_manager
-        self.__logger = self._configurations_manager.load_log_configurations(
-                                        name=__name__,
-                                        log_configurations=self._log_settings)
+        self.__logger = utils.load_logger(self._configurations_manager,
+                                          __name__,
+                                          self._log_settings)
         self.__signal_manager = SignalManager(
                                         self._log_settings, self._configurations_manager)
-        signal.signal(signal.SIGINT,
-                      self.__signal_manager.interrupt_signal_handler
-                      )
-        signal.signal(signal.SIGTERM,
-                      self.__signal_manager.kill_signal_handler
-                      )
+        self.__signal_manager.install_signal_handlers()
         self.__stop_event = self.__signal_manager.shut_down_event
         self.__kill_event = self.__signal_manager.kill_event
+        # maximum time (in milliseconds) to wait for a message before
+        # re-checking whether the process is set to forcefully quit
+        self.__poll_timeout = poll_timeout
+        # pollers for the receiving sockets, built once per socket
+        self.__pollers = {}
         self.__logger.debug("initialized.")
 
     def receive(self, zmq_socket, topic=None):
@@ -55,9 +68,15 @@ class CommunicatorZMQ(CommunicatorBaseClass):
 
         Returns
         ------
-        message received
+        message received, or EVENT.FATAL if the process is forcefully quit, or
+        Response.ERROR if the received message could not be decoded
         """
         message = None
+        # wait for the message and for the signals at the same time
+        wakeup_fd = self.__signal_manager.wakeup_fd
+        poller = self.__pollers.get(zmq_socket)
+        if poller is None:
+            poller = self.__create_poller(zmq_socket, wakeup_fd)
         # wait until a message is received or the process is forcefully
         # quit
         while message is None:
@@ -66,18 +85,76 @@ class CommunicatorZMQ(CommunicatorBaseClass):
                 self.__logger.critical('quitting forcefully!')
                 return EVENT.FATAL
             # Otherwise, wait to receive the message
+            # NOTE the wait is bounded by the poll timeout so that the stop
+            # and kill events are re-checked even if no message arrives
             try:
-                message = zmq_socket.recv_pyobj()
+                ready = dict(poller.poll(self.__poll_timeout))
+                if wakeup_fd in ready:
+                    # Case, a signal is received, consume the notification
+                    # and re-check the events
+                    self.__signal_manager.clear_wakeup_fd()
+                    continue
+                if zmq_socket not in ready:
+                    # Case, poll time is out
+                    continue
+                frame = zmq_socket.recv()
             except Exception:
                 # Case, receive time is out
                 self.__logger.debug(f'socket: {zmq_socket} waiting for the response!')
                 # continue waiting
                 continue
+            # decode the received message
+            try:
+                message = self.__deserialize(frame)
+            except Exception:
+                # Case, message could not be decoded e.g. an enum frame with
+                # an unknown value
+                # NOTE it is not dropped silently, since the peer would
+                # otherwise wait forever for the reply
+                self.__logger.exception(
+                    'could not decode the message received on socket: %s',
+                    zmq_socket)
+                return Response.ERROR
 
         # Message is received
         self.__logger.debug(f'message received: {message}')
         return message
 
+    def __create_poller(self, zmq_socket, wakeup_fd):
+        """
+        helper function to create the poller for receiving from the socket,
+        and to keep it for the subsequent receives from the same socket.
+        """
+        poller = zmq.Poller()
+        poller.register(zmq_socket, zmq.POLLIN)
+        poller.register(wakeup_fd, zmq.POLLIN)
+        # NOTE the stop and kill events are file descriptors, so the wait is
+        # also woken up if they are set by other than the signal handlers
+        poller.register(self.__stop_event.fileno(), zmq.POLLIN)
+        poller.register(self.__kill_event.fileno(), zmq.POLLIN)
+        self.__pollers[zmq_socket] = poller
+        return poller
+
+    def __serialize(self, message):
+        """
+        helper function to serialize the message as a compact frame if it is
+        an enum, otherwise as a pickle.
+        """
+        tag = _TAGS_BY_ENUM.get(type(message))
+        if tag is not None:
+            return _ENUM_FRAME.pack(tag, message)
+        return pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def __deserialize(self, frame):
+        """
+        helper function to deserialize the message from a compact enum frame
+        or from a pickle.
+        """
+        if len(frame) == _ENUM_FRAME.size and frame[0] < len(_ENUMS_BY_TAG):
+            tag, value = _ENUM_FRAME.unpack(frame)
+            return _ENUMS_BY_TAG[tag](value)
+        return pickle.loads(frame)
+
     def send(self, message, zmq_socket):
         """sends the message to specified endpoint.
 
@@ -95,7 +172,7 @@ class CommunicatorZMQ(CommunicatorBaseClass):
         """
         self.__logger.debug(f'sending {message}')
         try:
-            zmq_socket.send_pyobj(message)
+            zmq_socket.send(self.__serialize(message))
             # message is sent
             return Response.OK
         except Exception:
@@ -128,7 +205,9 @@ class CommunicatorZMQ(CommunicatorBaseClass):
         try:
             if topic is not None:
                 # send topic in broadcast so the subscriber could filter it
-                zmq_socket.send_multipart([topic, pickle.dumps(message)])
+                zmq_socket.send_multipart(
+                    [topic,
+                     pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)])
             else:
                 # just broadcast the message
                 self.send(message, zmq_socket)
@@ -13,6 +13,7 @@
 # ------------------------------------------------------------------------------
 from EBRAINS_RichEndpoint.application_companion.common_enums import Response
 from EBRAINS_RichEndpoint.application_companion.common_enums import COMMANDS
+from EBRAINS_RichEndpoint.orchestrator import utils
 
 
 class ControlCommand:
@@ -21,9 +22,9 @@ class ControlCommand:
         comprises of steering command and parameters.
     """
     def __init__(self, log_settings, configurations_manager):
-        self.__logger = configurations_manager.load_log_configurations(
-            name="ControlCommand",
-            log_configurations=log_settings)
+        self.__logger = utils.load_logger(configurations_manager,
+                                          "ControlCommand",
+                                          log_settings)
         self.__command = {}
         self.__logger.debug("initialized")
     
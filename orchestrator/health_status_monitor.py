@@ -15,6 +15,7 @@ import threading
 import time
 import signal
 from EBRAINS_RichEndpoint.application_companion.common_enums import Response
+from EBRAINS_RichEndpoint.orchestrator import utils
 
 
 class HealthStatusMonitor:
@@ -30,9 +31,9 @@ class HealthStatusMonitor:
                  ) -> None:
         self._log_settings = log_settings
         self._configurations_manager = configurations_manager
-        self.__logger = self._configurations_manager.load_log_configurations(
-                                        name=__name__,
-                                        log_configurations=self._log_settings)
+        self.__logger = utils.load_logger(self._configurations_manager,
+                                          __name__,
+                                          self._log_settings)
         # proxy to registry service
         self.__health_registry_manager_proxy = service_registry_manager
         self.__network_delay = network_delay
@@ -10,13 +10,16 @@
 # Laboratory: Simulation Laboratory Neuroscience
 #       Team: Multi-scale Simulation and Design
 # ------------------------------------------------------------------------------
-import multiprocessing
+import logging
 import os
 import sys
 import signal
 import zmq 
 import pickle
 import base64
+from collections import deque
+from operator import itemgetter
+from types import MappingProxyType
 
 from common.utils import networking_utils
 from common.utils.security_utils import check_integrity
@@ -29,6 +32,7 @@ from EBRAINS_RichEndpoint.orchestrator.health_status_monitor import HealthStatus
 from EBRAINS_RichEndpoint.orchestrator.zmq_sockets import ZMQSockets
 from EBRAINS_RichEndpoint.orchestrator.communication_endpoint import Endpoint
 from EBRAINS_RichEndpoint.orchestrator.control_command import ControlCommand
+from EBRAINS_RichEndpoint.orchestrator import utils
 from EBRAINS_RichEndpoint.application_companion.signal_manager import SignalManager
 from EBRAINS_RichEndpoint.application_companion.common_enums import EVENT, INTEGRATED_SIMULATOR_APPLICATION
 from EBRAINS_RichEndpoint.application_companion.common_enums import SteeringCommands
@@ -41,24 +45,61 @@ from EBRAINS_ConfigManager.global_configurations_manager.xml_parsers.configurati
 
 
 class Orchestrator:
+    # NOTE the signal handlers are process-wide, so they are installed only
+    # once per process and shared by all instances
+    __signal_manager = None
+
+    # NOTE the executions of the steering commands are fixed for the class, so
+    # they are kept in a read-only mapping of the steering commands to the
+    # names of their executions
+    __STEERING_COMMAND_EXECUTIONS = MappingProxyType({
+        SteeringCommands.INIT: '_Orchestrator__execute_init_command',
+        SteeringCommands.START: '_Orchestrator__execute_start_command',
+        SteeringCommands.END: '_Orchestrator__execute_end_command'})
+
+    # responses indicating that something went wrong fatally
+    __FATAL_RESPONSES = frozenset({EVENT.STATE_UPDATE_FATAL,
+                                   EVENT.FATAL,
+                                   Response.ERROR})
+
+    # NOTE the attributes are stored in slots rather than in a per-instance
+    # __dict__
+    __slots__ = ('_log_settings',
+                 '_configurations_manager',
+                 '_proxy_manager_client',
+                 '__logger',
+                 '__health_registry_manager_proxy',
+                 '__validate_and_update_local_state_in_registry',
+                 '__update_global_state_in_registry',
+                 '__current_global_state_in_registry',
+                 '__system_up_time_in_registry',
+                 '__global_health_monitor',
+                 '__step_sizes',
+                 '__global_min_step_size',
+                 '__steering_commands_history',
+                 '__responses_received',
+                 '__command_and_control_service',
+                 '__command_and_steering_service_endpoint',
+                 '__orchestrator_registered_component',
+                 '__port_range',
+                 '__communicator',
+                 '__control_command',
+                 '__command_dispatch_table',
+                 '__cached_global_state',
+                 '__endpoint_with_steering_service',
+                 '__endpoint_with_command_control_service',
+                 '__endpoints_address',
+                 '__zmq_sockets',
+                 '__my_ip')
+
     def __init__(self, log_settings, configurations_manager,
                  proxy_manager_connection_details,
                  port_range=None):
         self._log_settings = log_settings
         self._configurations_manager = configurations_manager
-        self.__logger = self._configurations_manager.load_log_configurations(
-                                        name="Orchestrator",
-                                        log_configurations=self._log_settings)
-        # settings for signal handling
-        self.__signal_manager = SignalManager(self._log_settings,
-                                              self._configurations_manager)
-        signal.signal(signal.SIGINT,
-                      self.__signal_manager.interrupt_signal_handler
-                      )
-        signal.signal(signal.SIGTERM,
-                      self.__signal_manager.kill_signal_handler
-                      )
-       
+        self.__logger = utils.load_logger(self._configurations_manager,
+                                          "Orchestrator",
+                                          self._log_settings)
         # get client to Proxy Manager Server
         self._proxy_manager_client = ProxyManagerClient(
             self._log_settings,
@@ -76,6 +117,16 @@ class Orchestrator:
         # Now, get the proxy to registry manager
         self.__health_registry_manager_proxy =\
             self._proxy_manager_client.get_registry_proxy()
+        # bind the registry methods which are called for each steering command
+        # once, rather than resolving them on the proxy for every call
+        self.__validate_and_update_local_state_in_registry =\
+            self.__health_registry_manager_proxy.validate_and_update_local_state
+        self.__update_global_state_in_registry =\
+            self.__health_registry_manager_proxy.update_global_state
+        self.__current_global_state_in_registry =\
+            self.__health_registry_manager_proxy.current_global_state
+        self.__system_up_time_in_registry =\
+            self.__health_registry_manager_proxy.system_up_time
 
         # instantiate the global health and status monitor
         self.__global_health_monitor = HealthStatusMonitor(
@@ -86,16 +137,33 @@ class Orchestrator:
         self.__step_sizes = None
         self.__global_min_step_size = None
         self.__steering_commands_history = []
-        self.__responses_received = []
+        # keep track of only the most recent responses to bound the memory
+        self.__responses_received = deque(maxlen=256)
         self.__command_and_control_service = []
         self.__command_and_steering_service_endpoint = None
         self.__orchestrator_registered_component = None
         self.__port_range = port_range
         self.__communicator = None
         self.__control_command = None
+        self.__command_dispatch_table = None
+        self.__cached_global_state = None
         # self.__communicator_zmq = None
         self.__logger.debug("Orchestrator is initialized.")
 
+    @classmethod
+    def __install_signal_handlers(cls, log_settings, configurations_manager):
+        """
+        installs the handlers for signals such as SIGINT, etc. if they are not
+        yet installed in this process.
+        """
+        if cls.__signal_manager is not None:
+            # Case, handlers are already installed
+            return
+        # settings for signal handling
+        cls.__signal_manager = SignalManager(log_settings,
+                                             configurations_manager)
+        cls.__signal_manager.install_signal_handlers()
+
     @property
     def steering_commands_history(self): return self.__steering_commands_history
 
@@ -111,31 +179,11 @@ class Orchestrator:
         self.__logger.info("concluding the health and status monitoring.")
         self.__global_health_monitor.finalize_monitoring()
     
-    def __get_component_from_registry(self, target_components_category) -> list:
+    def __update_local_state(self, input_command, valid_global_state):
         """
-        helper function for retrieving the proxy of registered components by
-        category.
-
-        Parameters
-        ----------
-        target_components_category : SERVICE_COMPONENT_CATEGORY.Enum
-            Category of target service components
-
-        Returns
-        ------
-        components: list
-            list of components matches category with parameter
-            target_components_category
-        """
-        components = self.__health_registry_manager_proxy.\
-            find_all_by_category(target_components_category)
-        self.__logger.debug(
-            f'found components: {len(components)}')
-        return components
-
-    def __update_local_state(self, input_command):
-        """
-        helper function for updating the local state.
+        helper function for updating the local state if the global state is
+        valid. The validation, the update and the recording of the state
+        transition are done by registry in a single call.
 
         Parameters
         ----------
@@ -143,14 +191,18 @@ class Orchestrator:
         input_command: SteeringCommands.Enum
             the command to transit from the current state to next legal state
 
+        valid_global_state: STATES.Enum
+            the global state required for the transition
+
         Returns
         ------
         response code: int
             response code indicating whether or not the state is updated.
         """
-        return self.__health_registry_manager_proxy.update_local_state(
-                                    self.__orchestrator_registered_component,
-                                    input_command)
+        return self.__validate_and_update_local_state_in_registry(
+            self.__orchestrator_registered_component,
+            input_command,
+            valid_global_state)
 
     def __find_global_minimum_step_size(self, responses_from_actions):
         """
@@ -166,28 +218,18 @@ class Orchestrator:
         minimum step size: float
             the minimum step size of the list.
         """
-        # list of response dictionaries
-        step_sizes_with_pids = []
-        # remove responses without step_sizes (e.g. from InterscaleHubs)
-        for response in responses_from_actions:
-            self.__logger.debug(f"running dictionary of response: {response}")
-            if response == {}:
-                continue
-            else:
-                # append running dictionary containing pid and stepsize to list
-                step_sizes_with_pids.append(response)
-
-        self.__logger.debug(f"step_sizes_with_pids: {step_sizes_with_pids}")
+        # list of response dictionaries containing pid and stepsize
+        # NOTE remove responses without step_sizes (e.g. from InterscaleHubs)
+        step_sizes_with_pids = [response for response in responses_from_actions
+                                if response != {}]
+        self.__logger.debug("step_sizes_with_pids: %s", step_sizes_with_pids)
 
         # find minimum step size in the list of responses
+        step_size = itemgetter(
+            INTEGRATED_SIMULATOR_APPLICATION.LOCAL_MINIMUM_STEP_SIZE.name)
         try:
-            # extract all step sizes from the list
-            step_sizes = [
-                sub[INTEGRATED_SIMULATOR_APPLICATION.LOCAL_MINIMUM_STEP_SIZE.name]
-                for sub in step_sizes_with_pids]
-            self.__logger.debug(f'step_sizes: {step_sizes}')
             # return minimum step size in the list
-            return min(step_sizes)
+            return step_size(min(step_sizes_with_pids, key=step_size))
         except KeyError:
             # the response does not contain step_size
             # log exception with traceback
@@ -195,15 +237,6 @@ class Orchestrator:
                                     f"{step_sizes_with_pids}")
             return Response.ERROR
 
-    def __receive_responses(self):
-        '''
-        helper function for receiving the responses from Application Companions
-        via C&C channel.
-        '''
-        self.__logger.debug('getting the response.')
-        return self.__communicator.receive(
-            self.__endpoint_with_command_control_service)
-
     # def __receive_responses(self):
     #     '''
     #     helper function for receiving the responses from Application Companions.
@@ -232,11 +265,12 @@ class Orchestrator:
         ------
         returns the processed response.
         '''
-        self.__logger.debug(f'got the response: {responses}')
+        self.__logger.debug('got the response: %s', responses)
         # Case, received local state update failure as response
-        if EVENT.STATE_UPDATE_FATAL in responses\
-                or EVENT.FATAL in responses\
-                or Response.ERROR in responses:
+        # NOTE the responses are checked in a single pass; only int responses
+        # are looked up since the others e.g. step sizes are not hashable
+        if any(isinstance(response, int) and response in self.__FATAL_RESPONSES
+               for response in responses):
             self.__logger.critical('directing C&C to terminate with error.')
             # send terminate command to C&C service
             self.__send_terminate_command(EVENT.STATE_UPDATE_FATAL)
@@ -249,7 +283,7 @@ class Orchestrator:
         # Case, find the minimum step-size if steering command is INIT
         if steering_command == SteeringCommands.INIT:
             self.__step_sizes = responses
-            self.__logger.debug(f'step_sizes and PIDs: {self.__step_sizes}')
+            self.__logger.debug('step_sizes and PIDs: %s', self.__step_sizes)
             self.__global_min_step_size = self.__find_global_minimum_step_size(
                 self.__step_sizes)
             # check if global minimum step size could not be determined
@@ -286,32 +320,36 @@ class Orchestrator:
         self.__logger.info(f'Executing command: {steering_command.name}')
         # prepare the control command
         self.__prepare_contorl_command(steering_command)
-        self.__logger.debug(f'sending the command: {self.__control_command.command}')
+        self.__logger.debug('sending the command: %s',
+                            self.__control_command.command)
         # pickle and encode Control Command object
         control_command = multiprocess_utils.b64encode_and_pickle(
             self.__logger, self.__control_command)
-        # 1. send steering command to C&C service
-        if self.__communicator.send(
-                control_command,
-                self.__endpoint_with_command_control_service) ==\
-                Response.ERROR:
-            try:
-                # Case a, something went wrong while sending
-                # raise an exception
-                raise RuntimeError
+        # 1. send steering command to C&C service and receive the responses
+        send_response, responses = self.__communicator.send_and_receive(
+            control_command,
+            self.__endpoint_with_command_control_service)
+        if send_response == Response.ERROR:
+            # Case a, something went wrong while sending
             # NOTE relevant exception is already logged by Communicator
-            except Exception:
-                # log the exception with traceback
-                self.__logger.exception('could not send the command.')
+            # log the error with stack trace
+            self.__logger.error('could not send the command.', stack_info=True)
             # return with with error
             return Response.ERROR
 
         # Case b, command is sent, record the command in history
         self.__steering_commands_history.append(steering_command.name)
 
-        # 2. Receive the responses
-        self.__logger.debug('getting the response.')
-        responses = self.__receive_responses()
+        # 2. check if the responses are received
+        # NOTE the responses are received as a list, an int code instead
+        # e.g. EVENT.FATAL indicates that receiving them is aborted
+        if isinstance(responses, int):
+            # Case, the process is forcefully quit while waiting for the
+            # responses
+            self.__logger.error('quit while waiting for the responses: %s',
+                                responses, stack_info=True)
+            # return with with error
+            return Response.ERROR
 
         # 3. process responses
         if self.__process_responses(responses, steering_command) == Response.ERROR:
@@ -322,8 +360,8 @@ class Orchestrator:
             return Response.ERROR
 
         # Case b, the command is executed successfully and everything went well
-        self.__logger.debug(f'Successfully executed the command:'
-                            f'{steering_command.name}')
+        self.__logger.debug('Successfully executed the command: %s',
+                            steering_command.name)
         return Response.OK
 
     def __prepare_contorl_command(self, steering_command):
@@ -334,8 +372,8 @@ class Orchestrator:
             parameters = self.global_minimum_step_size
         # prepare the control command
         self.__control_command.prepare(steering_command, parameters)
-        self.__logger.debug("prepared the command: "
-                            f"{self.__control_command.command}")
+        self.__logger.debug("prepared the command: %s",
+                            self.__control_command.command)
     
     def __execute_if_validated(self, steering_command, valid_state):
         '''
@@ -357,74 +395,70 @@ class Orchestrator:
             and the global state is transitioned
         '''
         # i. check if the global state is valid for steering_command execution
-        if self.current_global_state() != valid_state:
-            self.__logger.critical(
-                f'Global state must be {valid_state} for executing'
-                f'the steering command: {steering_command}')
-            return Response.ERROR
-
-        # ii. update local state and state transition history
-        state_before_transition = self.__orchestrator_registered_component.current_state
-        self.__orchestrator_registered_component = self.__update_local_state(steering_command)
+        # and if so, update local state and state transition history
+        self.__orchestrator_registered_component = self.__update_local_state(
+            steering_command, valid_state)
         if self.__orchestrator_registered_component == Response.ERROR:
-            # local state could not be updated
+            # global state is not valid or local state could not be updated
             # NOTE an exception with traceback has already been logged in
             # callee function
-            self.__logger.critical('Error updating the local state.')
+            self.__logger.critical(
+                f'Error updating the local state for executing the steering '
+                f'command: {steering_command}')
             return Response.ERROR
-        state_after_transition = self.__orchestrator_registered_component.current_state
-        self.__health_registry_manager_proxy.update_state_transition_history(
-            state_before_transition.name, steering_command.name,
-            state_after_transition.name
-        )
 
-        # iii. send steering command to Application Companions
-        self.__logger.debug(f'sending the command: {steering_command.name}')
+        # ii. send steering command to Application Companions
+        self.__logger.debug('sending the command: %s', steering_command.name)
         if self.__execute_steering_command(steering_command) == Response.ERROR:
             self.__logger.critical(f'Error executing steering command: '
                                    f'{steering_command}')
             return Response.ERROR
 
-        # iv. update global state if it is not yet updated by global health monitor
+        # iii. update global state if it is not yet updated by global health monitor
         if self.__update_global_state() == Response.ERROR:
             self.__logger.critical('Error updating the global state.')
             return Response.ERROR
 
         # everything goes right
-        self.__logger.info(f'Global state now: {self.current_global_state()}')
+        self.__logger.info(f'Global state now: {self.__cached_global_state}')
         self.__logger.info(f'uptime till now: {self.up_time_till_now()}')
         return Response.OK
 
     def __register_with_registry(self):
-        '''helper function to register with registry.'''
-        if self.__health_registry_manager_proxy.register(
+        '''
+        helper function to register with registry. The registered component
+        and the C&C service are fetched from registry in the same call.
+        '''
+        registration = self.__health_registry_manager_proxy.register_and_lookup(
                         os.getpid(),  # id
                         SERVICE_COMPONENT_CATEGORY.ORCHESTRATOR,   # category
                         SERVICE_COMPONENT_CATEGORY.ORCHESTRATOR,   # name
                         self.__endpoints_address,  # endpoint
                         SERVICE_COMPONENT_STATUS.UP,  # current status
-                        STATES.READY) == Response.ERROR:  # current state
+                        STATES.READY,  # current state
+                        # categories of components to fetch
+                        [SERVICE_COMPONENT_CATEGORY.COMMAND_AND_CONTROL])
+        if registration == Response.ERROR:
             # Case, registration fails
-            try:
-                # raise run time error exception
-                raise RuntimeError
-            except RuntimeError:
-                # log the exception with traceback
-                self.__logger.exception('Could not be registered. Quitting!')
-                # raise signal to terminate
-                signal.raise_signal(signal.SIGTERM)
+            # log the error with stack trace
+            self.__logger.error('Could not be registered. Quitting!',
+                                stack_info=True)
+            # raise signal to terminate
+            signal.raise_signal(signal.SIGTERM)
             # terminate with error
             return Response.ERROR
 
         # Case, registration is done
-        # retrieve proxy to registered component which is later needed to
-        # update the states
-        self.__orchestrator_registered_component =\
-            self.__health_registry_manager_proxy.find_by_id(os.getpid())
+        # keep proxy to registered component which is later needed to update
+        # the states, and proxy to C&C service to set up the channel with it
+        self.__orchestrator_registered_component, components_by_category =\
+            registration
+        self.__command_and_control_service = components_by_category[
+            SERVICE_COMPONENT_CATEGORY.COMMAND_AND_CONTROL]
         self.__logger.debug(
-            f'component service id: '
-            f'{self.__orchestrator_registered_component.id}'
-            f'; name: {self.__orchestrator_registered_component.name}')
+            'component service id: %s; name: %s',
+            self.__orchestrator_registered_component.id,
+            self.__orchestrator_registered_component.name)
         return Response.OK
 
     def __setup_endpoints(self):
@@ -434,9 +468,9 @@ class Orchestrator:
         if self.__port_range is None:
             # proxies to the shared queues
             # for in-coming messages
-            self.__endpoint_with_steering_service = multiprocessing.Manager().Queue()
+            self.__endpoint_with_steering_service = utils.queue_manager().Queue()
             # for out-going messages
-            self.__endpoint_with_command_control_service = multiprocessing.Manager().Queue()
+            self.__endpoint_with_command_control_service = utils.queue_manager().Queue()
             self.__endpoints_address = {
                 # endpoint with Steering service to receive the commands
                 SERVICE_COMPONENT_CATEGORY.STEERING_SERVICE:
@@ -490,19 +524,14 @@ class Orchestrator:
         helper function to set up communication channels with steering CLI
         and C&C service
         """
-        # 1. fetch proxy to C&C from registry
-        self.__command_and_control_service =\
-            self.__get_component_from_registry(
-                        SERVICE_COMPONENT_CATEGORY.COMMAND_AND_CONTROL
-                        )
-        self.__logger.debug(f'command and steering service: '
-                            f'{self.__command_and_control_service[0]}')
-
-        if self.__command_and_control_service == Response.ERROR:
+        # 1. check proxy to C&C fetched from registry at registration
+        if not self.__command_and_control_service:
             self.__logger.critical('Proxy to Command and Control service is '
                                    'not found in registry')
             # return with error to terminate
             return Response.ERROR
+        self.__logger.debug('command and steering service: %s',
+                            self.__command_and_control_service[0])
 
         # 2. fetch C&C endpoint to communicate with Orchestrator
         self.__command_and_steering_service_endpoint =\
@@ -536,6 +565,18 @@ class Orchestrator:
                 self._log_settings,
                 self._configurations_manager)
 
+    def __setup_command_dispatch_table(self):
+        """
+        helper function to create a table of executions for the steering
+        commands, indexed by the int value of the steering command.
+        NOTE the entries for the unsupported commands are None.
+        """
+        self.__command_dispatch_table = [None] * (max(SteeringCommands) + 1)
+        for steering_command, execution in\
+                self.__STEERING_COMMAND_EXECUTIONS.items():
+            self.__command_dispatch_table[steering_command] =\
+                getattr(self, execution)
+
     def __setup_runtime(self):
         """
         helper function for setting up runtime such as register with registry,
@@ -561,15 +602,18 @@ class Orchestrator:
         self.__control_command = ControlCommand(self._log_settings,
                                                 self._configurations_manager) 
 
-        # 6. update global state
+        # 6. build the table of executions for the steering commands
+        self.__setup_command_dispatch_table()
+
+        # 7. update global state
         if self.__update_global_state() == Response.ERROR:
             self.__logger.critical('Error updating the global state.')
             return Response.ERROR
 
-        # 7. start monitoring threads
+        # 8. start monitoring threads
         self.__start_global_health_monitoring()
 
-        # 8. all is setup now start orchestration
+        # 9. all is setup now start orchestration
         return Response.OK
 
     def __terminate_with_error(self):
@@ -610,6 +654,13 @@ class Orchestrator:
         # when responded with 'ERROR'
         return Response.ERROR
 
+    def __handle_not_valid_command(self):
+        self.__logger.critical('quitting due to the not supported command!')
+        # return with ERROR to terminate with error
+        # NOTE an exception is logged with traceback by calling function
+        # when responded with 'ERROR'
+        return Response.ERROR
+
     def __command_control_and_coordinate(self):
         '''
         Main loop to command, control and coordinate the other components.
@@ -618,32 +669,43 @@ class Orchestrator:
         ii) Forcefully: receiving the FATAL command i.e. either due to pressing
         CTRL+C, or if the global state is ERROR.
         '''
-        # create a dictionary of choices for the steering commands and
-        # their corresponding executions
-        command_execution_choices = {
-                        EVENT.FATAL: self.__handle_fatal_event,
-                        SteeringCommands.INIT: self.__execute_init_command,
-                        SteeringCommands.START: self.__execute_start_command,
-                        SteeringCommands.END: self.__execute_end_command}
+        # bind the frequently used attributes once before entering the loop
+        command_dispatch_table = self.__command_dispatch_table
+        number_of_executions = len(command_dispatch_table)
+        current_global_state = self.__current_global_state_in_registry
+        receive = self.__communicator.receive
+        send = self.__communicator.send
+        steering_service_endpoint = self.__endpoint_with_steering_service
+        logger = self.__logger
+        # NOTE fetching the global state for logging costs a call to registry,
+        # so it is fetched only if debug logging is enabled
+        is_debug_enabled = logger.isEnabledFor(logging.DEBUG)
         while True:
-            self.__logger.debug(
-                    f'current global state: '
-                    f'{self.__health_registry_manager_proxy.current_global_state()}')
+            if is_debug_enabled:
+                logger.debug('current global state: %s',
+                             current_global_state())
             # fetch the steering command
-            current_steering_command = self.__communicator.receive(
-                                                self.__endpoint_with_steering_service)
-            self.__logger.debug(f'got the command {current_steering_command}')
+            current_steering_command = receive(steering_service_endpoint)
+            logger.debug('got the command %s', current_steering_command)
+            # find the execution for the steering command
+            # NOTE EVENT.FATAL lies outside the range of steering command values
+            if current_steering_command == EVENT.FATAL:
+                execute_command = self.__handle_fatal_event
+            elif 0 <= current_steering_command < number_of_executions and\
+                    command_dispatch_table[current_steering_command] is not None:
+                execute_command = command_dispatch_table[current_steering_command]
+            else:
+                # Case, the command is not supported
+                logger.error('%s: %s', Response.NOT_VALID_COMMAND.name,
+                             current_steering_command)
+                execute_command = self.__handle_not_valid_command
             # execute the steering command
-            if command_execution_choices[current_steering_command]() ==\
-                    Response.ERROR:
+            if execute_command() == Response.ERROR:
                 # something went wrong
-                try:
-                    # raise run time error exception
-                    raise RuntimeError
-                except RuntimeError:
-                    # log the exception with traceback
-                    self.__logger.exception(
-                        f'error executing: {current_steering_command}')
+                # log the error with stack trace
+                self.__logger.error(
+                    f'error executing: {current_steering_command}',
+                    stack_info=True)
                 # terminate loudly with error
                 self.__communicator.send(
                     self.__terminate_with_error(),
@@ -679,30 +741,38 @@ class Orchestrator:
 
             # Execution is not yet ended, fetch the next steering commands
             # self.__orchestrator_out_queue.put(Response.OK)
-            self.__communicator.send(Response.OK,
-                                     self.__endpoint_with_steering_service)
+            send(Response.OK, steering_service_endpoint)
             continue
 
     def current_global_state(self):
         """Wrapper to get the current global state of the System."""
-        return self.__health_registry_manager_proxy.current_global_state()
+        return self.__current_global_state_in_registry()
 
     def current_global_status(self):
         """Wrapper to get the current global status of the System."""
         return self.__health_registry_manager_proxy.current_global_status()
 
     def __update_global_state(self):
-        """Wrapper to update the current global state of the System."""
-        return self.__health_registry_manager_proxy.update_global_state()
+        """
+        Wrapper to update the current global state of the System. The global
+        state is cached if it is updated successfully.
+        """
+        global_state = self.__update_global_state_in_registry()
+        if global_state != Response.ERROR:
+            self.__cached_global_state = global_state
+        return global_state
 
     def up_time_till_now(self):
         """Wrapper to get the up time of the system since the start."""
-        return self.__health_registry_manager_proxy.system_up_time()
+        return self.__system_up_time_in_registry()
     
     def run(self):
         """
         executes the steering and commands, and orchestrates the workflow.
         """
+        # install the signal handlers in the process running the orchestration
+        self.__install_signal_handlers(self._log_settings,
+                                       self._configurations_manager)
         self.__logger.info("running at hostname: "
                            f"{networking_utils.my_host_name()}, "
                            f"ip: {networking_utils.my_ip()}")
@@ -11,9 +11,15 @@
 # Laboratory: Simulation Laboratory Neuroscience
 #       Team: Multi-scale Simulation and Design
 # -----------------------------------------------------------------------------
+import multiprocessing
 import pickle
 import base64
 
+# manager server process shared by all the queues created by this process
+_queue_manager = None
+# loggers already configured in this process, by name
+_loggers = {}
+
 def parse_command(logger, command):
         """
         helper function to parse commands received by Application Companion,
@@ -27,4 +33,37 @@ def parse_command(logger, command):
         current_steering_command, parameters = control_command.parse()
         logger.debug(f"steering command: {current_steering_command.name}, "
                      f"parameters: {parameters}")
-        return control_command, current_steering_command, parameters
\ No newline at end of file
+        return control_command, current_steering_command, parameters
+
+
+def queue_manager():
+        """
+        returns the manager for creating the shared queues.
+        NOTE each multiprocessing.Manager() starts a new server process, so the
+        manager is started at the first call and is reused afterwards by all
+        the components running in this process.
+        """
+        global _queue_manager
+        if _queue_manager is None:
+            _queue_manager = multiprocessing.Manager()
+        return _queue_manager
+
+
+def load_logger(configurations_manager, name, log_settings):
+        """
+        returns the logger for the given name. The logger is configured via
+        the configurations manager only at the first call for the name, and
+        is reused afterwards by all the objects in this process, so that the
+        log handlers are not installed again and again.
+        NOTE the loggers are cached by name only, i.e. the log settings of the
+        first call for a name win for the whole process, and the settings
+        passed to the later calls for the same name are ignored. It matches
+        logging.getLogger() which also returns the same logger per name.
+        """
+        logger = _loggers.get(name)
+        if logger is None:
+            logger = configurations_manager.load_log_configurations(
+                name=name,
+                log_configurations=log_settings)
+            _loggers[name] = logger
+        return logger
@@ -117,19 +117,18 @@ class HealthRegistryManager(metaclass=MetaHealthRegistryManager):
 
     def __update_global_state(self, next_valid_global_state):
         """helper function to transit the global state to next valid state."""
-        self.__global_health_keeper.update_global_state(
+        new_global_state = self.__global_health_keeper.update_global_state(
             next_valid_global_state)
         # record the transition to history
-        self.__global_state_transition_history.append(
-            self.current_global_state().name)
+        self.__global_state_transition_history.append(new_global_state.name)
         self.__logger.debug(f'current global state state after update: '
-                            f'{self.current_global_state()}')
+                            f'{new_global_state}')
         if next_valid_global_state == STATES.ERROR:
             # log the exception with traceback
             self.__log_exception_with_traceback('Transition Rule is not satisfied')
             return Response.ERROR
         else:
-            return Response.OK
+            return new_global_state
 
     def __update_local_state(self, target_component, next_valid_state):
         """helper function to update the local state of target component"""
@@ -193,6 +192,41 @@ class HealthRegistryManager(metaclass=MetaHealthRegistryManager):
         # register the data object in registry
         return self.__service_registry.register(service_component)
 
+    def register_and_lookup(self, id, name, category, endpoint,
+                            current_status, current_state,
+                            categories_to_lookup):
+        """
+        registers the service component, and fetches the registered component
+        and the components of the given categories from registry in a single
+        call.
+
+        Parameters
+        ----------
+        id, name, category, endpoint, current_status, current_state :
+            same as for register()
+
+        categories_to_lookup : list
+            categories (SERVICE_COMPONENT_CATEGORY) of components to fetch
+
+        Returns
+        -------
+         if registered, a tuple of the registered component and a dictionary
+         of the given categories to the lists of their components;
+         otherwise, an int code representing error.
+        """
+        if self.register(id, name, category, endpoint,
+                         current_status, current_state) == Response.ERROR:
+            # log exception with traceback
+            self.__log_exception_with_traceback(f'{name}: could not be '
+                                                'registered.')
+            # return with error to terminate
+            return Response.ERROR
+
+        components_by_category = {
+            target_category: self.find_all_by_category(target_category)
+            for target_category in categories_to_lookup}
+        return self.find_by_id(id), components_by_category
+
     # NOTE: This functionality is provided only for the sake of completion.
     # Uncomment it if the functionality is needed.
     # def de_register(self, component):
@@ -320,8 +354,8 @@ class HealthRegistryManager(metaclass=MetaHealthRegistryManager):
         1) Checks whether the constraints are met for global state transition
         2) Updates the global state to the next valid global state as per
         transition rules.
-        Returns an int code indicating whether or not the globals state is
-        updated.
+        Returns the current global state if it is updated (or already
+        up-to-date); otherwise, an int code representing error.
         """
         self.__logger.debug(f'current global state before update: '
                             f'{self.current_global_state()}')
@@ -340,7 +374,7 @@ class HealthRegistryManager(metaclass=MetaHealthRegistryManager):
         # check if globals state is already updated by global health monitor
         if self.current_global_state() == next_valid_global_state:
             self.__logger.debug("global state is already up-to-date")
-            return Response.OK
+            return next_valid_global_state
 
         # 3) otherwise, update the global state
         return self.__update_global_state(next_valid_global_state)
@@ -383,6 +417,51 @@ class HealthRegistryManager(metaclass=MetaHealthRegistryManager):
         # update component's local state to next legal state
         return self.__update_local_state(component, next_legal_state)
 
+    def validate_and_update_local_state(self, component, input_command,
+                                        valid_global_state):
+        """
+        validates the current global state and if it is valid, updates the
+        current state of the given component in registry and records the
+        state transition in the local state transition history.
+
+        Parameters
+        ----------
+        component : ServiceComponent
+            proxy to service component whose local state is to be updated
+
+        input_command: SteeringCommands.Enum
+            the command to transit from the current state to next legal state
+
+        valid_global_state: STATES.Enum
+            the global state required for the transition
+
+        Returns
+        -------
+            if updated, proxy to updated component;
+            otherwise, an int code representing error.
+        """
+        # validate the global state
+        if self.current_global_state() != valid_global_state:
+            # log exception with traceback
+            self.__log_exception_with_traceback(
+                f'Global state must be {valid_global_state} for executing '
+                f'the steering command: {input_command}')
+            # return with ERROR to terminate
+            return Response.ERROR
+
+        # update the local state
+        state_before_transition = component.current_state
+        updated_component = self.update_local_state(component, input_command)
+        if updated_component == Response.ERROR:
+            # NOTE an exception with traceback has already been logged
+            return Response.ERROR
+
+        # record the state transition
+        self.update_state_transition_history(
+            state_before_transition.name, input_command.name,
+            updated_component.current_state.name)
+        return updated_component
+
     def components_with_status_down(self, all_components):
         """
         Filters the components with status 'DOWN' from the list of given
@@ -11,9 +11,9 @@
 #       Team: Multi-scale Simulation and Design
 # ------------------------------------------------------------------------------
 from datetime import datetime
-from EBRAINS_RichEndpoint.application_companion.common_enums import Response
 from EBRAINS_RichEndpoint.registry_state_machine.health_status import HealthStatus
 from EBRAINS_RichEndpoint.registry_state_machine.state_enums import STATES
+from EBRAINS_RichEndpoint.orchestrator import utils
 
 
 class HealthStatusKeeper:
@@ -23,9 +23,9 @@ class HealthStatusKeeper:
     def __init__(self, log_settings, configurations_manager) -> None:
         self._log_settings = log_settings
         self._configurations_manager = configurations_manager
-        self.__logger = self._configurations_manager.load_log_configurations(
-                                        name=__name__,
-                                        log_configurations=self._log_settings)
+        self.__logger = utils.load_logger(self._configurations_manager,
+                                          __name__,
+                                          self._log_settings)
 
         # instantiate the health and status data object,
         self.__health_status = HealthStatus()
@@ -69,6 +69,7 @@ class HealthStatusKeeper:
     def update_global_state(self, new_global_state):
         """"
         updates the global state if all local states are same.
+        returns the new global state.
         """
         # self.__logger.debug(f"current global state: '"
         #                     f"{self.current_global_state()}'")
@@ -80,7 +81,7 @@ class HealthStatusKeeper:
         self.__update_last_health_updated()
         self.__logger.debug(f"new global state: '{self.current_global_state()}'"
                             f" updated at {self.__last_health_check()}")
-        return Response.OK
+        return self.current_global_state()
 
     
     # def update_global_state(self):
@@ -11,6 +11,8 @@
 # Laboratory: Simulation Laboratory Neuroscience
 # Team: Multi-scale Simulation and Design
 # ------------------------------------------------------------------------------
+from collections import defaultdict
+
 from EBRAINS_RichEndpoint.application_companion.common_enums import Response
 
 
@@ -21,6 +23,9 @@ class ServiceRegistry:
     '''
     def __init__(self) -> None:
         self.__registry = []
+        # indexes to look up the components by id and by category
+        self.__registry_by_id = {}
+        self.__registry_by_category = defaultdict(list)
 
     def register(self, component):
         """
@@ -36,6 +41,10 @@ class ServiceRegistry:
          return code as int
         """
         if(self.__registry.append(component) is None):
+            # update the indexes
+            # NOTE in case of duplicate ids, the first registered is found
+            self.__registry_by_id.setdefault(component.id, component)
+            self.__registry_by_category[component.category].append(component)
             return Response.OK
         else:
             return Response.ERROR
@@ -63,13 +72,7 @@ class ServiceRegistry:
         proxy to found component;
         returns None if not found.
         '''
-        for component in self.__registry:
-            if component.id == component_id:
-                # Case a: component is found
-                return component
-
-        # Case b: component is not found
-        return None
+        return self.__registry_by_id.get(component_id)
 
     def find_by_name(self, component_name):
         '''
@@ -99,9 +102,8 @@ class ServiceRegistry:
 
     def find_all_by_category(self, category):
         '''fetches all from registry by given category.'''
-        components = [component for component in self.__registry
-                      if component.category == category]
-        return components
+        # NOTE a copy is returned so that the index could not be altered
+        return list(self.__registry_by_category.get(category, []))
 
     def find_all_by_status(self, status):
         '''fetches all from registry by given status.'''
@@ -125,4 +127,22 @@ class ServiceRegistry:
             if old_component.id == component.id:
                 self.__registry[index] = component
                 is_updated = True
+        if is_updated:
+            # update the indexes
+            old_category = self.__registry_by_id[component.id].category
+            self.__registry_by_id[component.id] = component
+            if old_category == component.category:
+                # Case a, category is not changed, update it in its bucket
+                components = self.__registry_by_category[component.category]
+                for index, old_component in enumerate(components):
+                    if old_component.id == component.id:
+                        components[index] = component
+            else:
+                # Case b, category is changed, move it to the new bucket
+                self.__registry_by_category[old_category] = [
+                    old_component for old_component in
+                    self.__registry_by_category[old_category]
+                    if old_component.id != component.id]
+                self.__registry_by_category[component.category].append(
+                    component)
         return is_updated
@@ -0,0 +1,78 @@
+import logging
+import signal
+import unittest
+from unittest import mock
+
+import zmq
+
+from EBRAINS_RichEndpoint.application_companion.common_enums import EVENT
+from EBRAINS_RichEndpoint.application_companion.common_enums import Response
+from EBRAINS_RichEndpoint.application_companion.common_enums import SteeringCommands
+from EBRAINS_RichEndpoint.orchestrator import communicator_zmq
+from EBRAINS_RichEndpoint.orchestrator.communicator_zmq import CommunicatorZMQ
+
+
+class TestCommunicatorZMQSerialization(unittest.TestCase):
+    """Tests the wire format of the messages sent by ``CommunicatorZMQ``."""
+    def setUp(self):
+        # keep the signal handlers to restore them after the test, since the
+        # communicator installs its own
+        self.__sigint_handler = signal.getsignal(signal.SIGINT)
+        self.__sigterm_handler = signal.getsignal(signal.SIGTERM)
+        configurations_manager = mock.Mock()
+        configurations_manager.load_log_configurations.side_effect = \
+            lambda name, log_configurations: logging.getLogger(name)
+        self.__communicator = CommunicatorZMQ(None, configurations_manager)
+        self.__context = zmq.Context()
+        self.__receiver = self.__context.socket(zmq.PAIR)
+        self.__receiver.bind('inproc://test_communicator_zmq')
+        self.__sender = self.__context.socket(zmq.PAIR)
+        self.__sender.connect('inproc://test_communicator_zmq')
+
+    def tearDown(self):
+        self.__sender.close()
+        self.__receiver.close()
+        self.__context.term()
+        signal.set_wakeup_fd(-1)
+        signal.signal(signal.SIGINT, self.__sigint_handler)
+        signal.signal(signal.SIGTERM, self.__sigterm_handler)
+
+    def __send_and_receive(self, message):
+        self.__communicator.send(message, self.__sender)
+        return self.__communicator.receive(self.__receiver)
+
+    def test_enums_round_trip(self):
+        """Case: the enums are sent as compact frames.
+        Every member of the tagged enum classes should be received as the
+        same member.
+        """
+        for enum_class in (SteeringCommands, Response, EVENT):
+            for member in enum_class:
+                received = self.__send_and_receive(member)
+                # tests: the same member of the same enum class is received
+                self.assertIs(member, received)
+
+    def test_pickled_payloads_round_trip(self):
+        """Case: the messages other than enums are sent as pickles.
+        The dict and list payloads should be received as equal ones.
+        """
+        payloads = [{'step_size': 0.1, 'pid': 1234},
+                    [Response.OK, 0.05, {'pid': 42}]]
+        for payload in payloads:
+            # tests: an equal payload is received
+            self.assertEqual(payload, self.__send_and_receive(payload))
+
+    def test_enum_frame_with_unknown_value(self):
+        """Case: an enum frame carries a value unknown to the enum class.
+        It should not be dropped silently but returned as Response.ERROR.
+        """
+        frame = communicator_zmq._ENUM_FRAME.pack(
+            communicator_zmq._TAGS_BY_ENUM[Response], 12345)
+        self.__sender.send(frame)
+        # tests: receiving the undecodable message returns error
+        self.assertIs(Response.ERROR,
+                      self.__communicator.receive(self.__receiver))
+
+
+if __name__ == "__main__":
+    unittest.main()
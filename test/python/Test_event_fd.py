@@ -0,0 +1,82 @@
+import os
+import pickle
+import threading
+import time
+import unittest
+from EBRAINS_RichEndpoint.application_companion.signal_manager import EventFD
+
+
+class TestEventFD(unittest.TestCase):
+    """Tests the behavior of the file descriptor backed event ``EventFD``."""
+    def setUp(self):
+        self.__event = EventFD()
+
+    def tearDown(self):
+        self.__event.close()
+
+    def test_set_and_clear(self):
+        """Case: the event is set and then cleared.
+        is_set() should follow the set() and clear() calls.
+        """
+        # tests: a new event is not set
+        self.assertFalse(self.__event.is_set())
+        self.__event.set()
+        # tests: the event is set, also if it is set more than once
+        self.__event.set()
+        self.assertTrue(self.__event.is_set())
+        self.__event.clear()
+        # tests: the event is not set after clearing it
+        self.assertFalse(self.__event.is_set())
+
+    def test_wait_with_timeout(self):
+        """Case: waiting for the event with a timeout.
+        It should return False if the event is not set until the timeout
+        expires, otherwise True.
+        """
+        # tests: the wait expires if the event is not set
+        self.assertFalse(self.__event.wait(0.01))
+        self.__event.set()
+        # tests: the wait returns immediately if the event is set
+        self.assertTrue(self.__event.wait(1))
+
+    def test_set_by_forked_child(self):
+        """Case: the event is set by a forked child process.
+        It should be set in the parent process as well.
+        """
+        pid = os.fork()
+        if pid == 0:
+            # child process
+            self.__event.set()
+            os._exit(0)
+        os.waitpid(pid, 0)
+        # tests: the event set by the child is set in the parent
+        self.assertTrue(self.__event.is_set())
+
+    def test_pickle(self):
+        """Case: pickling the event.
+        It should raise TypeError since the descriptor would be meaningless
+        in another process.
+        """
+        with self.assertRaises(TypeError):
+            pickle.dumps(self.__event)
+
+    def test_concurrent_wait_and_is_set(self):
+        """Case: is_set() is called while wait() is blocked in another thread.
+        Neither of them should fail, and the wait should return True once the
+        event is set.
+        """
+        results = []
+        waiting_thread = threading.Thread(
+            target=lambda: results.append(self.__event.wait(5)))
+        waiting_thread.start()
+        time.sleep(0.1)  # let the thread block in wait()
+        # tests: is_set() does not fail while wait() is blocked
+        self.assertFalse(self.__event.is_set())
+        self.__event.set()
+        waiting_thread.join()
+        # tests: the blocked wait returns True once the event is set
+        self.assertEqual([True], results)
+
+
+if __name__ == "__main__":
+    unittest.main()